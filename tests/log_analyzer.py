@@ -4,219 +4,404 @@ Advanced DataPusher Plus Analytics Engine
 Provides enterprise-grade insights and predictive analysis
 """
 
+import os
 import re
+import mmap
 import csv
 import sys
-import statistics
 import json
+import math
+import pickle
+import stat
+import tempfile
 from pathlib import Path
 from datetime import datetime, timedelta
-from collections import defaultdict, Counter
-import hashlib
+from collections import defaultdict, Counter, namedtuple
+from functools import lru_cache
+from fractions import Fraction
+from operator import itemgetter
+from itertools import groupby, chain, repeat
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
-def parse_worker_logs(log_file_path):
-    """Parse worker logs and extract job information"""
+# Per-phase timing columns and the short phase name used in metric keys
+PHASE_FIELDS = {
+    'download_time': 'download',
+    'analysis_time': 'analysis',
+    'copying_time': 'copying',
+    'indexing_time': 'indexing',
+    'formulae_time': 'formulae',
+    'metadata_time': 'metadata'
+}
+
+# Worker log patterns, compiled once rather than looked up per job entry.
+# They match bytes since the log is scanned through an mmap
+# Job start: timestamp INFO [job_id] Setting log level to INFO
+JOB_START_PATTERN = re.compile(rb'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3}) INFO\s+\[([a-f0-9-]{36})\] Setting log level to INFO')
+JOB_START_MARKER = b'] Setting log level to INFO'
+FILE_URL_PATTERN = re.compile(rb'Fetching from: (?=.)(?:.*/)?([^/\n]*)')
+QSV_VERSION_PATTERN = re.compile(rb'qsv version found: ([\d.]+)')
+FILE_FORMAT_PATTERN = re.compile(rb'File format: (\w+)')
+ENCODING_PATTERN = re.compile(rb'Identified encoding of the file: (\w+)')
+SORTED_PATTERN = re.compile(rb'Sorted: (True|False)')
+UNSAFE_HEADER_NAMES_PATTERN = re.compile(rb'"(\d+) unsafe" header names found')
+ANALYSIS_DONE_PATTERN = re.compile(rb'ANALYSIS DONE! Analyzed and prepped in ([\d.]+) seconds')
+RECORDS_PATTERN = re.compile(rb'(\d+)\s+records detected')
+RECORDS_MARKER = b'records detected'
+# Timing breakdown printed in the job summary after "DATAPUSHER+ JOB DONE!"
+TIMING_PATTERNS = {
+    'total_time': re.compile(rb'TOTAL ELAPSED TIME: ([\d.]+)'),
+    'download_time': re.compile(rb'Download: ([\d.]+)'),
+    'analysis_time': re.compile(rb'Analysis: ([\d.]+)'),
+    'copying_time': re.compile(rb'COPYing: ([\d.]+)'),
+    'indexing_time': re.compile(rb'Indexing: ([\d.]+)'),
+    'formulae_time': re.compile(rb'Formulae processing: ([\d.]+)'),
+    'metadata_time': re.compile(rb'Resource metadata updates: ([\d.]+)')
+}
+ROWS_COPIED_PATTERN = re.compile(rb'Copied (\d+) rows to')
+COLUMNS_INDEXED_PATTERN = re.compile(rb'Indexed (\d+) column/s')
+JOB_ERROR_PATTERN = re.compile(rb'ckanext\.datapusher_plus\.utils\.JobError: (.+)')
+
+# Phase timings reported by the insights command and their display labels
+INSIGHT_PHASES = {
+    'download_time': 'Download',
+    'analysis_time': 'Analysis',
+    'copying_time': 'Copy'
+}
+
+# Columns of the worker analysis CSV, in output order. The enrichment columns
+# are only present on jobs that have been through enrich_job()
+PARSED_JOB_FIELDS = (
+    'timestamp', 'job_id', 'file_name', 'status', 'qsv_version', 'file_format',
+    'encoding', 'normalized', 'valid_csv', 'sorted', 'db_safe_headers', 'analysis',
+    'records', 'total_time', 'download_time', 'analysis_time', 'copying_time',
+    'indexing_time', 'formulae_time', 'metadata_time', 'rows_copied', 'columns_indexed',
+    'error_type', 'error_message'
+)
+ENRICHMENT_FIELDS = ('data_quality_score', 'processing_efficiency')
+WORKER_ANALYSIS_FIELDS = PARSED_JOB_FIELDS + ENRICHMENT_FIELDS
+
+# Numeric columns of the worker analysis CSV
+FLOAT_FIELDS = ('total_time', 'download_time', 'analysis_time', 'copying_time',
+                'indexing_time', 'formulae_time', 'metadata_time')
+INT_FIELDS = ('records', 'rows_copied', 'columns_indexed')
+# Low-cardinality text columns, interned when parsing the CSV so repeated
+# values share one string object and the pickle sidecar stores each once
+INTERNED_FIELDS = ('status', 'qsv_version', 'file_format', 'encoding', 'normalized',
+                   'valid_csv', 'sorted', 'analysis', 'error_type')
+
+# Record-count bucket labels and their upper bounds (small <100, medium <10k)
+SIZE_BUCKETS = ('small', 'medium', 'large')
+SIZE_BUCKET_BOUNDS = (100, 10000)
+
+# Failures closer together than this count as one sequential run
+SEQUENTIAL_FAILURE_WINDOW = timedelta(minutes=5)
+
+# Totals shared by the business metrics and executive summary
+JobAggregates = namedtuple('JobAggregates', [
+    'total_jobs', 'success_count', 'error_count', 'total_records',
+    'total_processing_time', 'avg_processing_time', 'avg_error_time',
+    'avg_data_quality', 'quality_sla_count'
+])
+
+# Even with workers requested, smaller logs are parsed in-process; starting
+# workers and pickling their results back would outweigh the speedup
+PARALLEL_PARSE_MIN_BYTES = 16 * 1024 * 1024
+
+# Bump when the shape of loaded jobs changes to invalidate pickle sidecars
+JOBS_CACHE_VERSION = 2
+# Appended to the CSV's full name, so the sidecar can't collide with an
+# unrelated file that merely shares the CSV's stem
+JOBS_CACHE_SUFFIX = '.jobs-cache.pkl'
+
+# Unsafe header count in the db_safe_headers summary
+UNSAFE_HEADERS_PATTERN = re.compile(r'(\d+) unsafe headers', re.IGNORECASE | re.ASCII)
+
+@lru_cache(maxsize=1 << 17)
+def _parse_ts(timestamp):
+    """Parse a job timestamp, caching the result since many jobs share one"""
+    # Timestamps are always '%Y-%m-%d %H:%M:%S', so slice the digits directly
+    # rather than going through strptime's format parser
+    if len(timestamp) != 19:
+        return None
     try:
-        with open(log_file_path, 'r') as f:
-            log_content = f.read()
+        return datetime(int(timestamp[0:4]), int(timestamp[5:7]), int(timestamp[8:10]),
+                        int(timestamp[11:13]), int(timestamp[14:16]), int(timestamp[17:19]))
+    except ValueError:
+        return None
+
+def _mean_of_ints(total, count):
+    """Mean of count ints summing to total, typed the way statistics.mean is"""
+    # An exact mean stays an int; otherwise true division gives the same
+    # correctly rounded float that statistics.mean returns
+    quotient, remainder = divmod(total, count)
+    return quotient if remainder == 0 else total / count
+
+def _mean_of_floats(values):
+    """Correctly rounded mean of floats, equal to statistics.mean"""
+    # fsum's residual recovers the rest of the exact total, so one Fraction
+    # division rounds once; only when that residual is itself inexact (huge
+    # cancellations) fall back to statistics' exact Fraction sum
+    total = math.fsum(values)
+    residual = math.fsum([*values, -total])
+    if math.fsum([*values, -total, -residual]) == 0:
+        exact_total = Fraction(total) + Fraction(residual)
+    else:
+        exact_total = sum(map(Fraction, values))
+    return float(exact_total / len(values))
+
+def find_marked_matches(pattern, marker, content, pos=0, endpos=None):
+    """Yield matches of a pattern that ends in a literal marker, leftmost first"""
+    # Patterns starting with a digit class give SRE no literal prefix to skip
+    # ahead on, so it attempts a match at every byte. Find the marker with a
+    # plain substring search and only run the pattern over its line instead
+    if endpos is None:
+        endpos = len(content)
+    marker_pos = content.find(marker, pos, endpos)
+    while marker_pos >= 0:
+        marker_end = marker_pos + len(marker)
+        line_start = max(content.rfind(b'\n', pos, marker_pos) + 1, pos)
+        match = pattern.search(content, line_start, marker_end)
+        if match:
+            yield match
+        marker_pos = content.find(marker, marker_end, endpos)
+
+def iter_job_range(log_content, pos, endpos):
+    """Yield the jobs whose entries start within log_content[pos:endpos]"""
+    # Each job entry runs from its start line up to the next job's start
+    previous_start = None
+    for match in find_marked_matches(JOB_START_PATTERN, JOB_START_MARKER, log_content, pos, endpos):
+        if previous_start:
+            job = parse_job_entry(previous_start, log_content[previous_start.start():match.start()])
+            if job:
+                yield job
+        previous_start = match
+    if previous_start:
+        job = parse_job_entry(previous_start, log_content[previous_start.start():endpos])
+        if job:
+            yield job
+
+def parse_log_file_range(log_file_path, pos, endpos):
+    """Worker entry point: map the log and parse one byte range of it"""
+    with open(log_file_path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as log_content:
+            return list(iter_job_range(log_content, pos, endpos))
+
+def split_job_ranges(log_content, chunks):
+    """Split a log into roughly equal byte ranges that begin on job starts"""
+    size = len(log_content)
+    bounds = [0]
+    for i in range(1, chunks):
+        match = next(find_marked_matches(JOB_START_PATTERN, JOB_START_MARKER,
+                                         log_content, size * i // chunks), None)
+        if match is None:
+            break
+        if match.start() > bounds[-1]:
+            bounds.append(match.start())
+    bounds.append(size)
+    return list(zip(bounds, bounds[1:]))
+
+def open_worker_log(log_file_path):
+    """Map a worker log read-only, or return None if it is empty or unreadable"""
+    try:
+        with open(log_file_path, 'rb') as f:
+            log_stat = os.fstat(f.fileno())
+            if stat.S_ISREG(log_stat.st_mode):
+                if log_stat.st_size == 0:
+                    return None
+                # Map the log rather than reading it into memory; entries are
+                # sliced out of the mapping one at a time as they are parsed
+                try:
+                    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except (ValueError, OSError):
+                    pass
+            # Pipes, FIFOs and process substitution can't be mapped (and
+            # report a size of 0), so read those into memory instead
+            return f.read()
     except FileNotFoundError:
         print(f"Log file not found: {log_file_path}")
-        return []
     except Exception as e:
         print(f"Error reading log file: {e}")
+    return None
+
+def close_worker_log(log_content):
+    """Release a log opened by open_worker_log"""
+    if isinstance(log_content, mmap.mmap):
+        log_content.close()
+
+def parse_worker_logs(log_file_path, workers=1):
+    """Parse worker logs and extract job information"""
+    log_content = open_worker_log(log_file_path)
+    if log_content is None:
         return []
 
-    # Split log into individual job entries by looking for job start pattern
-    # Pattern: timestamp INFO [job_id] Setting log level to INFO
-    job_pattern = r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3}) INFO\s+\[([a-f0-9-]{36})\] Setting log level to INFO'
-    
-    # Find all job starts
-    job_starts = list(re.finditer(job_pattern, log_content))
-    processed_jobs = []
+    try:
+        if (workers > 1 and isinstance(log_content, mmap.mmap)
+                and len(log_content) >= PARALLEL_PARSE_MIN_BYTES):
+            # Opt-in via workers > 1. Entries are independent, so large logs
+            # are split on job starts and parsed in worker processes. Each
+            # worker maps the same file, so ranges share the page cache
+            ranges = split_job_ranges(log_content, workers)
+            try:
+                with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+                    return list(chain.from_iterable(executor.map(
+                        parse_log_file_range, repeat(log_file_path), *zip(*ranges))))
+            except (OSError, BrokenProcessPool):
+                # No working process support here (e.g. a sandbox without
+                # /dev/shm, or workers killed on start), so parse in-process
+                pass
+        return list(iter_job_range(log_content, 0, len(log_content)))
+    finally:
+        close_worker_log(log_content)
 
-    for i, match in enumerate(job_starts):
-        job_start_pos = match.start()
-        job_end_pos = job_starts[i + 1].start() if i + 1 < len(job_starts) else len(log_content)
-        
-        entry = log_content[job_start_pos:job_end_pos]
-        
-        # Extract timestamp and job ID from the match
-        timestamp_str = match.group(1)
-        job_id = match.group(2)
-
-        # Convert timestamp to standard format
-        try:
-            dt = datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S,%f')
-            timestamp = dt.strftime('%Y-%m-%d %H:%M:%S')
-        except:
-            timestamp = timestamp_str
-
-        # Extract file information
-        file_url_match = re.search(r'Fetching from: (.+)', entry)
-        file_url = file_url_match.group(1).strip() if file_url_match else "unknown"
-        file_name = file_url.split('/')[-1] if file_url != "unknown" else "unknown"
-
-        # Determine job status
-        if "DATAPUSHER+ JOB DONE!" in entry:
-            status = "SUCCESS"
-        elif "ckanext.datapusher_plus.utils.JobError:" in entry:
-            status = "ERROR"
-        else:
-            status = "INCOMPLETE"
+def parse_job_entry(match, entry):
+    """Extract job information from a single job entry of the worker log"""
+    # Extract timestamp and job ID from the match
+    timestamp_str = match.group(1).decode('ascii')
+    job_id = match.group(2).decode('ascii')
 
-        # Extract QSV version
-        qsv_version_match = re.search(r'qsv version found: ([\d.]+)', entry)
-        qsv_version = qsv_version_match.group(1) if qsv_version_match else ""
+    # Convert timestamp to standard format. The start pattern already fixes
+    # the layout, so dropping the milliseconds is a slice; _parse_ts still
+    # rejects out-of-range fields, and enrich_job later hits its cache
+    timestamp = timestamp_str[:19]
+    if _parse_ts(timestamp) is None:
+        timestamp = timestamp_str
 
-        # Extract file format
-        file_format_match = re.search(r'File format: (\w+)', entry)
-        file_format = file_format_match.group(1) if file_format_match else ""
+    # Extract file information
+    file_url_match = FILE_URL_PATTERN.search(entry)
+    file_name = file_url_match.group(1).decode('utf-8', 'replace').strip() if file_url_match else "unknown"
 
-        # Extract encoding
-        encoding_match = re.search(r'Identified encoding of the file: (\w+)', entry)
-        encoding = encoding_match.group(1) if encoding_match else ""
+    # Determine job status, keeping the marker offsets so the timing and
+    # error extraction below can start from them instead of rescanning
+    summary_pos = entry.find(b"DATAPUSHER+ JOB DONE!")
+    error_pos = -1
+    if summary_pos >= 0:
+        status = "SUCCESS"
+    else:
+        error_pos = entry.find(b"ckanext.datapusher_plus.utils.JobError:")
+        status = "ERROR" if error_pos >= 0 else "INCOMPLETE"
 
-        # Check normalization
-        normalized = "Successful" if "Normalized & transcoded" in entry else "Failed"
+    # Extract QSV version
+    qsv_version_match = QSV_VERSION_PATTERN.search(entry)
+    qsv_version = qsv_version_match.group(1).decode('ascii') if qsv_version_match else ""
 
-        # Check if valid CSV
-        valid_csv = "TRUE" if "Well-formed, valid CSV file confirmed" in entry else "FALSE"
+    # Extract file format
+    file_format_match = FILE_FORMAT_PATTERN.search(entry)
+    file_format = file_format_match.group(1).decode('ascii') if file_format_match else ""
 
-        # Check if sorted
-        sorted_match = re.search(r'Sorted: (True|False)', entry)
-        sorted_status = sorted_match.group(1).upper() if sorted_match else "UNKNOWN"
+    # Extract encoding
+    encoding_match = ENCODING_PATTERN.search(entry)
+    encoding = encoding_match.group(1).decode('ascii') if encoding_match else ""
 
-        # Check database safe headers
-        unsafe_headers_match = re.search(r'"(\d+) unsafe" header names found', entry)
-        if unsafe_headers_match:
-            unsafe_count = int(unsafe_headers_match.group(1))
-            db_safe_headers = f"{unsafe_count} unsafe headers found"
-        elif "No unsafe header names found" in entry:
-            db_safe_headers = "All headers safe"
-        else:
-            db_safe_headers = "Unknown"
-
-        # Check analysis status
-        analysis_match = re.search(r'ANALYSIS DONE! Analyzed and prepped in ([\d.]+) seconds', entry)
-        analysis_status = "Successful" if analysis_match else "Failed"
-
-        # Extract records detected
-        records_match = re.search(r'(\d+)\s+records detected', entry)
-        records_processed = int(records_match.group(1)) if records_match else 0
-
-        # Extract timing information
-        timings = {
-            'total_time': 0.0,
-            'download_time': 0.0,
-            'analysis_time': 0.0,
-            'copying_time': 0.0,
-            'indexing_time': 0.0,
-            'formulae_time': 0.0,
-            'metadata_time': 0.0
-        }
+    # Check normalization
+    normalized = "Successful" if b"Normalized & transcoded" in entry else "Failed"
 
-        # Parse timing breakdown from the job summary
-        total_time_match = re.search(r'TOTAL ELAPSED TIME: ([\d.]+)', entry)
-        if total_time_match:
-            timings['total_time'] = float(total_time_match.group(1))
-
-        download_match = re.search(r'Download: ([\d.]+)', entry)
-        if download_match:
-            timings['download_time'] = float(download_match.group(1))
-
-        analysis_match = re.search(r'Analysis: ([\d.]+)', entry)
-        if analysis_match:
-            timings['analysis_time'] = float(analysis_match.group(1))
-
-        copying_match = re.search(r'COPYing: ([\d.]+)', entry)
-        if copying_match:
-            timings['copying_time'] = float(copying_match.group(1))
-
-        indexing_match = re.search(r'Indexing: ([\d.]+)', entry)
-        if indexing_match:
-            timings['indexing_time'] = float(indexing_match.group(1))
-
-        formulae_match = re.search(r'Formulae processing: ([\d.]+)', entry)
-        if formulae_match:
-            timings['formulae_time'] = float(formulae_match.group(1))
-
-        metadata_match = re.search(r'Resource metadata updates: ([\d.]+)', entry)
-        if metadata_match:
-            timings['metadata_time'] = float(metadata_match.group(1))
-
-        # Extract rows copied
-        rows_copied_match = re.search(r'Copied (\d+) rows to', entry)
-        rows_copied = int(rows_copied_match.group(1)) if rows_copied_match else 0
-
-        # Extract columns indexed
-        indexed_match = re.search(r'Indexed (\d+) column/s', entry)
-        columns_indexed = int(indexed_match.group(1)) if indexed_match else 0
-
-        # Extract specific DataPusher Plus error
-        error_type = ""
-        error_message = ""
-
-        if status == "ERROR":
-            # Look for specific DataPusher Plus JobError
-            dp_error_match = re.search(r'ckanext\.datapusher_plus\.utils\.JobError: (.+?)(?:\n|$)', entry)
-            if dp_error_match:
-                error_message = dp_error_match.group(1).strip()
-                # Classify error type based on message content
-                if "invalid Zip archive" in error_message or "EOCD" in error_message:
-                    error_type = "CORRUPTED_EXCEL"
-                elif "qsv command failed" in error_message:
-                    error_type = "QSV_ERROR"
-                elif "Only http, https, and ftp resources may be fetched" in error_message:
-                    error_type = "INVALID_URL"
-                else:
-                    error_type = "DATAPUSHER_ERROR"
+    # Check if valid CSV
+    valid_csv = "TRUE" if b"Well-formed, valid CSV file confirmed" in entry else "FALSE"
+
+    # Check if sorted
+    sorted_match = SORTED_PATTERN.search(entry)
+    sorted_status = sorted_match.group(1).decode('ascii').upper() if sorted_match else "UNKNOWN"
+
+    # Check database safe headers
+    unsafe_headers_match = UNSAFE_HEADER_NAMES_PATTERN.search(entry)
+    if unsafe_headers_match:
+        unsafe_count = int(unsafe_headers_match.group(1))
+        db_safe_headers = f"{unsafe_count} unsafe headers found"
+    elif b"No unsafe header names found" in entry:
+        db_safe_headers = "All headers safe"
+    else:
+        db_safe_headers = "Unknown"
+
+    # Check analysis status
+    analysis_match = ANALYSIS_DONE_PATTERN.search(entry)
+    analysis_status = "Successful" if analysis_match else "Failed"
+
+    # Extract records detected
+    records_match = next(find_marked_matches(RECORDS_PATTERN, RECORDS_MARKER, entry), None)
+    records_processed = int(records_match.group(1)) if records_match else 0
+
+    # Parse timing breakdown from the job summary. It follows the JOB DONE
+    # marker, so only the tail of a successful entry needs scanning
+    timings = dict.fromkeys(TIMING_PATTERNS, 0.0)
+    summary_pos = max(summary_pos, 0)
+    for field, pattern in TIMING_PATTERNS.items():
+        timing_match = pattern.search(entry, summary_pos)
+        if timing_match:
+            timings[field] = float(timing_match.group(1))
+
+    # Extract rows copied
+    rows_copied_match = ROWS_COPIED_PATTERN.search(entry)
+    rows_copied = int(rows_copied_match.group(1)) if rows_copied_match else 0
+
+    # Extract columns indexed
+    indexed_match = COLUMNS_INDEXED_PATTERN.search(entry)
+    columns_indexed = int(indexed_match.group(1)) if indexed_match else 0
+
+    # Extract specific DataPusher Plus error
+    error_type = ""
+    error_message = ""
+
+    if status == "ERROR":
+        # Look for specific DataPusher Plus JobError
+        dp_error_match = JOB_ERROR_PATTERN.search(entry, error_pos)
+        if dp_error_match:
+            error_message = dp_error_match.group(1).decode('utf-8', 'replace').strip()
+            # Classify error type based on message content
+            if "invalid Zip archive" in error_message or "EOCD" in error_message:
+                error_type = "CORRUPTED_EXCEL"
+            elif "qsv command failed" in error_message:
+                error_type = "QSV_ERROR"
+            elif "Only http, https, and ftp resources may be fetched" in error_message:
+                error_type = "INVALID_URL"
             else:
-                error_type = "UNKNOWN_ERROR"
-                error_message = "Unknown DataPusher error"
-
-        # Only add jobs that have valid job IDs and meaningful data
-        if job_id and job_id != "unknown":
-            processed_jobs.append({
-                'timestamp': timestamp,
-                'job_id': job_id,
-                'file_name': file_name,
-                'status': status,
-                'qsv_version': qsv_version,
-                'file_format': file_format,
-                'encoding': encoding,
-                'normalized': normalized,
-                'valid_csv': valid_csv,
-                'sorted': sorted_status,
-                'db_safe_headers': db_safe_headers,
-                'analysis': analysis_status,
-                'records': records_processed,
-                'total_time': timings['total_time'],
-                'download_time': timings['download_time'],
-                'analysis_time': timings['analysis_time'],
-                'copying_time': timings['copying_time'],
-                'indexing_time': timings['indexing_time'],
-                'formulae_time': timings['formulae_time'],
-                'metadata_time': timings['metadata_time'],
-                'rows_copied': rows_copied,
-                'columns_indexed': columns_indexed,
-                'error_type': error_type,
-                'error_message': error_message.replace('"', '""') if error_message else ""  # Escape quotes for CSV
-            })
+                error_type = "DATAPUSHER_ERROR"
+        else:
+            error_type = "UNKNOWN_ERROR"
+            error_message = "Unknown DataPusher error"
 
-    return processed_jobs
+    # Only add jobs that have valid job IDs and meaningful data
+    if not job_id or job_id == "unknown":
+        return None
+    return {
+        'timestamp': timestamp,
+        'job_id': job_id,
+        'file_name': file_name,
+        'status': status,
+        'qsv_version': qsv_version,
+        'file_format': file_format,
+        'encoding': encoding,
+        'normalized': normalized,
+        'valid_csv': valid_csv,
+        'sorted': sorted_status,
+        'db_safe_headers': db_safe_headers,
+        'analysis': analysis_status,
+        'records': records_processed,
+        'total_time': timings['total_time'],
+        'download_time': timings['download_time'],
+        'analysis_time': timings['analysis_time'],
+        'copying_time': timings['copying_time'],
+        'indexing_time': timings['indexing_time'],
+        'formulae_time': timings['formulae_time'],
+        'metadata_time': timings['metadata_time'],
+        'rows_copied': rows_copied,
+        'columns_indexed': columns_indexed,
+        'error_type': error_type,
+        'error_message': error_message  # csv.writer quotes this as needed
+    }
 
 def write_worker_analysis(jobs, output_file):
     """Write job analysis to CSV file"""
-    fieldnames = ['timestamp', 'job_id', 'file_name', 'status', 'qsv_version', 'file_format', 
-                  'encoding', 'normalized', 'valid_csv', 'sorted', 'db_safe_headers', 'analysis',
-                  'records', 'total_time', 'download_time', 'analysis_time', 'copying_time', 
-                  'indexing_time', 'formulae_time', 'metadata_time', 'rows_copied', 'columns_indexed',
-                  'error_type', 'error_message', 'data_quality_score', 'processing_efficiency']
-    
+    # Parsed columns are pulled out of each job with a single itemgetter call
+    # rather than DictWriter's per-field lookups. Enrichment columns default
+    # to '' like DictWriter's restval, so unenriched jobs can be written too
+    parsed_values = itemgetter(*PARSED_JOB_FIELDS)
     with open(output_file, 'w', newline='') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames, extrasaction='ignore')
-        writer.writeheader()
-        writer.writerows(jobs)
+        writer = csv.writer(csvfile)
+        writer.writerow(WORKER_ANALYSIS_FIELDS)
+        writer.writerows(parsed_values(job) + tuple(map(job.get, ENRICHMENT_FIELDS, repeat('')))
+                         for job in jobs)
 
 def generate_performance_insights(jobs):
     """Generate performance insights from job data"""
@@ -226,69 +411,76 @@ def generate_performance_insights(jobs):
     insights = []
     
     if successful_jobs:
-        # Calculate performance metrics
-        total_times = [job['total_time'] for job in successful_jobs if job['total_time']]
-        download_times = [job['download_time'] for job in successful_jobs if job['download_time']]
-        analysis_times = [job['analysis_time'] for job in successful_jobs if job['analysis_time']]
-        copying_times = [job['copying_time'] for job in successful_jobs if job['copying_time']]
+        # Gather every metric in a single pass over the successful jobs
+        total_records = 0
+        total_rows_copied = 0
+        total_columns_indexed = 0
+        timed_count = 0
+        total_time_sum = 0.0
+        fastest = math.inf
+        slowest = -math.inf
+        phase_counts = dict.fromkeys(INSIGHT_PHASES, 0)
+        phase_sums = dict.fromkeys(INSIGHT_PHASES, 0.0)
+        qsv_versions = set()
+        format_counts = {}
         
-        # Calculate data metrics
-        total_records = sum(job['records'] for job in successful_jobs)
-        total_rows_copied = sum(job['rows_copied'] for job in successful_jobs)
-        total_columns_indexed = sum(job['columns_indexed'] for job in successful_jobs)
+        for job in successful_jobs:
+            total_records += job['records']
+            total_rows_copied += job['rows_copied']
+            total_columns_indexed += job['columns_indexed']
+            
+            total_time = job['total_time']
+            if total_time:
+                timed_count += 1
+                total_time_sum += total_time
+                if total_time < fastest:
+                    fastest = total_time
+                if total_time > slowest:
+                    slowest = total_time
+            
+            for field in INSIGHT_PHASES:
+                if job[field]:
+                    phase_counts[field] += 1
+                    phase_sums[field] += job[field]
+            
+            if job['qsv_version']:
+                qsv_versions.add(job['qsv_version'])
+            if job['file_format']:
+                format_counts[job['file_format']] = format_counts.get(job['file_format'], 0) + 1
         
         insights.append(f"Total Records Processed: {total_records:,}")
         insights.append(f"Total Rows Imported: {total_rows_copied:,}")
         insights.append(f"Total Columns Indexed: {total_columns_indexed}")
         
-        if total_times:
-            avg_total = statistics.mean(total_times)
-            fastest = min(total_times)
-            slowest = max(total_times)
+        if timed_count:
+            avg_total = total_time_sum / timed_count
             insights.append(f"Average Processing Time: {avg_total:.2f}s")
             insights.append(f"Fastest File: {fastest:.2f}s")
             insights.append(f"Slowest File: {slowest:.2f}s")
             
             if total_records > 0:
-                throughput = total_records / sum(total_times)
+                throughput = total_records / total_time_sum
                 insights.append(f"Processing Throughput: {throughput:,.0f} records/sec")
         
-        if download_times:
-            avg_download = statistics.mean(download_times)
-            insights.append(f"Average Download Time: {avg_download:.2f}s")
-        
-        if analysis_times:
-            avg_analysis = statistics.mean(analysis_times)
-            insights.append(f"Average Analysis Time: {avg_analysis:.2f}s")
-        
-        if copying_times:
-            avg_copying = statistics.mean(copying_times)
-            insights.append(f"Average Copy Time: {avg_copying:.2f}s")
+        for field, label in INSIGHT_PHASES.items():
+            if phase_counts[field]:
+                insights.append(f"Average {label} Time: {phase_sums[field] / phase_counts[field]:.2f}s")
 
         # QSV version analysis
-        qsv_versions = [job['qsv_version'] for job in successful_jobs if job['qsv_version']]
         if qsv_versions:
-            unique_versions = list(set(qsv_versions))
-            insights.append(f"QSV Versions Used: {', '.join(unique_versions)}")
+            insights.append(f"QSV Versions Used: {', '.join(qsv_versions)}")
 
         # File format analysis
-        formats = [job['file_format'] for job in successful_jobs if job['file_format']]
-        if formats:
-            format_counts = {}
-            for fmt in formats:
-                format_counts[fmt] = format_counts.get(fmt, 0) + 1
+        if format_counts:
             format_summary = ', '.join([f"{fmt}({count})" for fmt, count in format_counts.items()])
             insights.append(f"File Formats Processed: {format_summary}")
     
     # Error analysis
     if error_jobs:
-        error_types = {}
-        for job in error_jobs:
-            error_type = job['error_type']
-            error_types[error_type] = error_types.get(error_type, 0) + 1
+        error_types = Counter(job['error_type'] for job in error_jobs)
         
-        most_common_error = max(error_types, key=error_types.get)
-        insights.append(f"Most Common Error: {most_common_error} ({error_types[most_common_error]} occurrences)")
+        most_common_error, occurrences = error_types.most_common(1)[0]
+        insights.append(f"Most Common Error: {most_common_error} ({occurrences} occurrences)")
         
         if 'CORRUPTED_EXCEL' in error_types:
             insights.append(f"Corrupted Excel Files: {error_types['CORRUPTED_EXCEL']}")
@@ -298,29 +490,33 @@ def generate_performance_insights(jobs):
     
     return insights
 
+def format_worker_insight(job):
+    """Format the worker insight string for a single job"""
+    if job['status'] == 'SUCCESS':
+        records = job['records']
+        total_time = job['total_time']
+        phases = []
+        if job['download_time'] > 0.1:
+            phases.append(f"DL:{job['download_time']:.1f}s")
+        if job['analysis_time'] > 0.1:
+            phases.append(f"AN:{job['analysis_time']:.1f}s")
+        if job['copying_time'] > 0.1:
+            phases.append(f"CP:{job['copying_time']:.1f}s")
+        
+        phase_info = "|".join(phases[:2])  # Limit to 2 phases
+        if records > 0:
+            return f"{records}rec|{total_time:.1f}s|{phase_info}"
+        else:
+            return f"{total_time:.1f}s|{phase_info}"
+    elif job['status'] == 'ERROR':
+        return f"ERROR:{job['error_type']}"
+    return "No worker data"
+
 def get_worker_insight_for_file(jobs, target_file):
     """Get worker insight string for a specific file"""
     for job in jobs:
         if target_file in job['file_name'] or job['file_name'] in target_file:
-            if job['status'] == 'SUCCESS':
-                records = job['records']
-                total_time = job['total_time']
-                phases = []
-                if job['download_time'] > 0.1:
-                    phases.append(f"DL:{job['download_time']:.1f}s")
-                if job['analysis_time'] > 0.1:
-                    phases.append(f"AN:{job['analysis_time']:.1f}s")
-                if job['copying_time'] > 0.1:
-                    phases.append(f"CP:{job['copying_time']:.1f}s")
-                
-                phase_info = "|".join(phases[:2])  # Limit to 2 phases
-                if records > 0:
-                    return f"{records}rec|{total_time:.1f}s|{phase_info}"
-                else:
-                    return f"{total_time:.1f}s|{phase_info}"
-            elif job['status'] == 'ERROR':
-                return f"ERROR:{job['error_type']}"
-            break
+            return format_worker_insight(job)
     return "No worker data"
 
 # Enhanced Analytics Functions
@@ -333,9 +529,9 @@ def calculate_data_quality_score(job):
         score -= 30
     if job['sorted'] == 'FALSE':
         score -= 10
-    if 'unsafe headers' in job['db_safe_headers'].lower():
-        unsafe_count = int(re.search(r'(\d+)', job['db_safe_headers']).group(1)) if re.search(r'(\d+)', job['db_safe_headers']) else 0
-        score -= min(unsafe_count * 5, 25)
+    unsafe_match = UNSAFE_HEADERS_PATTERN.search(job['db_safe_headers'])
+    if unsafe_match:
+        score -= min(int(unsafe_match.group(1)) * 5, 25)
     if job['normalized'] != 'Successful':
         score -= 20
     if job['analysis'] != 'Successful':
@@ -344,26 +540,30 @@ def calculate_data_quality_score(job):
     # Bonus for good characteristics
     if job['encoding'] == 'UTF-8':
         score += 5
-    if int(job['records']) > 1000:
+    if job['records'] > 1000:
         score += 5
     
     return max(0, min(100, score))
 
-def detect_performance_anomalies(jobs):
+def detect_performance_anomalies(jobs, successful_jobs=None):
     """Detect performance anomalies using statistical analysis"""
     if len(jobs) < 3:
         return []
     
+    if successful_jobs is None:
+        successful_jobs = [job for job in jobs if job['status'] == 'SUCCESS']
     anomalies = []
-    total_times = [job['total_time'] for job in jobs if job['status'] == 'SUCCESS']
+    total_times = [job['total_time'] for job in successful_jobs]
     
     if len(total_times) >= 3:
-        mean_time = statistics.mean(total_times)
-        stdev_time = statistics.stdev(total_times)
+        # Plain float arithmetic; statistics.mean/stdev go through exact
+        # fractional sums that are far slower and unneeded here
+        mean_time = math.fsum(total_times) / len(total_times)
+        stdev_time = math.sqrt(math.fsum((t - mean_time) ** 2 for t in total_times) / (len(total_times) - 1))
         threshold = mean_time + (2 * stdev_time)
         
-        for job in jobs:
-            if job['status'] == 'SUCCESS' and job['total_time'] > threshold:
+        for job in successful_jobs:
+            if job['total_time'] > threshold:
                 anomalies.append({
                     'file': job['file_name'],
                     'job_id': job['job_id'],
@@ -375,119 +575,122 @@ def detect_performance_anomalies(jobs):
     
     return anomalies
 
-def analyze_failure_patterns(jobs):
+def analyze_failure_patterns(jobs, error_jobs=None):
     """Advanced failure pattern analysis"""
-    error_jobs = [job for job in jobs if job['status'] == 'ERROR']
+    if error_jobs is None:
+        error_jobs = [job for job in jobs if job['status'] == 'ERROR']
     patterns = {
         'by_file_format': Counter(),
-        'by_time_of_day': Counter(),
-        'by_file_size_proxy': Counter(),  # Using records as proxy
+        'by_time_of_day': {},
+        'by_file_size_proxy': {},  # Using records as proxy
         'sequential_failures': [],
         'recurring_files': Counter()
     }
     
+    # Hour and size buckets are tallied by index and only turned into labels
+    # once at the end; the dicts keep first-seen order, as the labelled
+    # Counters did
+    hour_counts = {}
+    size_counts = {}
+    failure_times = []
     for job in error_jobs:
         patterns['by_file_format'][job['file_format']] += 1
         
         # Time-based analysis
-        try:
-            dt = datetime.strptime(job['timestamp'], '%Y-%m-%d %H:%M:%S')
-            hour_bucket = f"{dt.hour:02d}:00-{dt.hour:02d}:59"
-            patterns['by_time_of_day'][hour_bucket] += 1
-        except:
-            pass
+        failure_time = _parse_ts(job['timestamp'])
+        if failure_time:
+            failure_times.append(failure_time)
+            hour_counts[failure_time.hour] = hour_counts.get(failure_time.hour, 0) + 1
         
         # File size analysis (using records as proxy)
-        records = int(job['records']) if job['records'] else 0
-        size_bucket = 'small' if records < 100 else 'medium' if records < 10000 else 'large'
-        patterns['by_file_size_proxy'][size_bucket] += 1
+        size_index = bisect_right(SIZE_BUCKET_BOUNDS, job['records'])
+        size_counts[size_index] = size_counts.get(size_index, 0) + 1
         
         patterns['recurring_files'][job['file_name']] += 1
     
-    # Detect sequential failures
-    error_jobs_sorted = sorted(error_jobs, key=lambda x: x['timestamp'])
-    consecutive_count = 0
-    for i, job in enumerate(error_jobs_sorted):
-        if i > 0:
-            prev_time = datetime.strptime(error_jobs_sorted[i-1]['timestamp'], '%Y-%m-%d %H:%M:%S')
-            curr_time = datetime.strptime(job['timestamp'], '%Y-%m-%d %H:%M:%S')
-            if (curr_time - prev_time).seconds < 300:  # Within 5 minutes
-                consecutive_count += 1
-            else:
-                if consecutive_count > 0:
-                    patterns['sequential_failures'].append(consecutive_count + 1)
-                consecutive_count = 0
+    patterns['by_time_of_day'] = {f"{hour:02d}:00-{hour:02d}:59": count
+                                  for hour, count in hour_counts.items()}
+    patterns['by_file_size_proxy'] = {SIZE_BUCKETS[index]: count
+                                      for index, count in size_counts.items()}
+    
+    # Detect sequential failures: runs of failures less than 5 minutes apart
+    failure_times.sort()
+    within_window = [curr - prev < SEQUENTIAL_FAILURE_WINDOW
+                     for prev, curr in zip(failure_times, failure_times[1:])]
+    patterns['sequential_failures'] = [sum(1 for _ in run) + 1
+                                       for close, run in groupby(within_window) if close]
     
     return patterns
 
-def calculate_processing_efficiency_metrics(jobs):
+def calculate_processing_efficiency_metrics(jobs, successful_jobs=None):
     """Calculate advanced efficiency metrics"""
-    successful_jobs = [job for job in jobs if job['status'] == 'SUCCESS']
+    if successful_jobs is None:
+        successful_jobs = [job for job in jobs if job['status'] == 'SUCCESS']
     if not successful_jobs:
         return {}
     
     metrics = {}
     
-    # Records per second throughput
-    total_records = sum(int(job['records']) for job in successful_jobs)
-    total_time = sum(job['total_time'] for job in successful_jobs)
-    metrics['overall_throughput'] = total_records / total_time if total_time > 0 else 0
-    
-    # Phase efficiency analysis
-    phase_times = {
-        'download': [job['download_time'] for job in successful_jobs],
-        'analysis': [job['analysis_time'] for job in successful_jobs],
-        'copying': [job['copying_time'] for job in successful_jobs],
-        'indexing': [job['indexing_time'] for job in successful_jobs],
-        'formulae': [job['formulae_time'] for job in successful_jobs],
-        'metadata': [job['metadata_time'] for job in successful_jobs]
-    }
-    
-    for phase, times in phase_times.items():
-        if times:
-            metrics[f'{phase}_avg'] = statistics.mean(times)
-            metrics[f'{phase}_efficiency'] = sum(times) / total_time * 100  # % of total time
-    
-    # Resource utilization scoring
+    # Gather every column in a single pass over the successful jobs
+    total_records = 0
+    total_time = 0.0
+    phase_values = {field: [] for field in PHASE_FIELDS}
     for job in successful_jobs:
-        records = int(job['records'])
+        records = job['records']
+        total_records += records
+        total_time += job['total_time']
+        for field, values in phase_values.items():
+            values.append(job[field])
+        
+        # Resource utilization scoring
         if records > 0:
             job['records_per_second'] = records / job['total_time']
             job['time_per_1k_records'] = job['total_time'] / (records / 1000) if records >= 1000 else job['total_time']
     
+    metrics['overall_throughput'] = total_records / total_time if total_time > 0 else 0
+    
+    # Phase efficiency analysis
+    for field, values in phase_values.items():
+        phase = PHASE_FIELDS[field]
+        metrics[f'{phase}_avg'] = _mean_of_floats(values)
+        metrics[f'{phase}_efficiency'] = sum(values) / total_time * 100  # % of total time
+    
     return metrics
 
-def generate_predictive_insights(jobs):
+def generate_predictive_insights(jobs, successful_jobs=None):
     """Generate predictive insights and recommendations"""
     insights = []
     
     # Failure prediction based on patterns
-    error_jobs = [job for job in jobs if job['status'] == 'ERROR']
-    if error_jobs:
-        error_formats = Counter(job['file_format'] for job in error_jobs)
-        total_jobs_by_format = Counter(job['file_format'] for job in jobs)
-        
-        for fmt, error_count in error_formats.items():
-            total_count = total_jobs_by_format[fmt]
-            failure_rate = error_count / total_count
-            if failure_rate > 0.3:  # 30% failure rate
-                insights.append({
-                    'type': 'HIGH_RISK_FORMAT',
-                    'format': fmt,
-                    'failure_rate': failure_rate,
-                    'recommendation': f'Review {fmt} file processing pipeline - {failure_rate:.1%} failure rate detected'
-                })
+    error_formats = defaultdict(int)
+    total_jobs_by_format = defaultdict(int)
+    for job in jobs:
+        total_jobs_by_format[job['file_format']] += 1
+        if job['status'] == 'ERROR':
+            error_formats[job['file_format']] += 1
+    
+    for fmt, error_count in error_formats.items():
+        total_count = total_jobs_by_format[fmt]
+        failure_rate = error_count / total_count
+        if failure_rate > 0.3:  # 30% failure rate
+            insights.append({
+                'type': 'HIGH_RISK_FORMAT',
+                'format': fmt,
+                'failure_rate': failure_rate,
+                'recommendation': f'Review {fmt} file processing pipeline - {failure_rate:.1%} failure rate detected'
+            })
     
     # Performance degradation detection
-    successful_jobs = [job for job in jobs if job['status'] == 'SUCCESS']
+    if successful_jobs is None:
+        successful_jobs = [job for job in jobs if job['status'] == 'SUCCESS']
     if len(successful_jobs) >= 6:
         # Compare first half vs second half performance
         mid_point = len(successful_jobs) // 2
         first_half = successful_jobs[:mid_point]
         second_half = successful_jobs[mid_point:]
         
-        avg_first = statistics.mean(job['total_time'] for job in first_half)
-        avg_second = statistics.mean(job['total_time'] for job in second_half)
+        avg_first = sum(job['total_time'] for job in first_half) / len(first_half)
+        avg_second = sum(job['total_time'] for job in second_half) / len(second_half)
         
         if avg_second > avg_first * 1.3:  # 30% slower
             insights.append({
@@ -497,53 +700,91 @@ def generate_predictive_insights(jobs):
             })
     
     # Data quality trend analysis
-    quality_scores = [calculate_data_quality_score(job) for job in successful_jobs]
-    if quality_scores and statistics.mean(quality_scores) < 80:
-        insights.append({
-            'type': 'DATA_QUALITY_CONCERN',
-            'avg_quality_score': statistics.mean(quality_scores),
-            'recommendation': 'Multiple data quality issues detected - implement data validation pipeline'
-        })
+    if successful_jobs:
+        # Scores are ints, so the plain sum is exact
+        avg_quality_score = _mean_of_ints(sum(job['data_quality_score'] for job in successful_jobs),
+                                          len(successful_jobs))
+        if avg_quality_score < 80:
+            insights.append({
+                'type': 'DATA_QUALITY_CONCERN',
+                'avg_quality_score': avg_quality_score,
+                'recommendation': 'Multiple data quality issues detected - implement data validation pipeline'
+            })
     
     return insights
 
-def generate_business_impact_metrics(jobs):
+def calculate_job_aggregates(jobs):
+    """Compute the totals shared by the summary analyzers in a single pass"""
+    success_count = 0
+    error_count = 0
+    total_records = 0
+    total_processing_time = 0.0
+    total_error_time = 0.0
+    total_quality = 0
+    quality_sla_count = 0
+    
+    for job in jobs:
+        if job['status'] == 'SUCCESS':
+            success_count += 1
+            total_records += job['records']
+            total_processing_time += job['total_time']
+            total_quality += job['data_quality_score']
+            if job['data_quality_score'] >= 85:
+                quality_sla_count += 1
+        elif job['status'] == 'ERROR':
+            error_count += 1
+            total_error_time += job['total_time']
+    
+    return JobAggregates(
+        total_jobs=len(jobs),
+        success_count=success_count,
+        error_count=error_count,
+        total_records=total_records,
+        total_processing_time=total_processing_time,
+        avg_processing_time=total_processing_time / success_count if success_count else 0,
+        avg_error_time=total_error_time / error_count if error_count else 0,
+        avg_data_quality=_mean_of_ints(total_quality, success_count) if success_count else 0,
+        quality_sla_count=quality_sla_count
+    )
+
+def generate_business_impact_metrics(jobs, aggregates=None):
     """Calculate business-relevant metrics"""
     metrics = {}
     
-    successful_jobs = [job for job in jobs if job['status'] == 'SUCCESS']
-    total_jobs = len(jobs)
+    if aggregates is None:
+        aggregates = calculate_job_aggregates(jobs)
+    total_jobs = aggregates.total_jobs
     
     # Availability metrics
-    metrics['system_availability'] = len(successful_jobs) / total_jobs if total_jobs > 0 else 0
-    metrics['mttr'] = calculate_mean_time_to_recovery(jobs)  # Simplified
+    metrics['system_availability'] = aggregates.success_count / total_jobs if total_jobs > 0 else 0
+    metrics['mttr'] = aggregates.avg_error_time  # Simplified: mean runtime of failed jobs
     
     # Data pipeline health
-    total_records = sum(int(job['records']) for job in successful_jobs)
-    total_processing_time = sum(job['total_time'] for job in successful_jobs)
-    
-    metrics['data_pipeline_efficiency'] = total_records / total_processing_time if total_processing_time > 0 else 0
-    metrics['cost_per_1k_records'] = estimate_processing_cost(successful_jobs)
+    total_processing_time = aggregates.total_processing_time
+    metrics['data_pipeline_efficiency'] = aggregates.total_records / total_processing_time if total_processing_time > 0 else 0
+    metrics['cost_per_1k_records'] = estimate_processing_cost_for_seconds(total_processing_time)
     
     # Quality impact
-    quality_scores = [calculate_data_quality_score(job) for job in successful_jobs]
-    metrics['avg_data_quality'] = statistics.mean(quality_scores) if quality_scores else 0
-    metrics['quality_sla_compliance'] = sum(1 for score in quality_scores if score >= 85) / len(quality_scores) if quality_scores else 0
+    metrics['avg_data_quality'] = aggregates.avg_data_quality
+    metrics['quality_sla_compliance'] = aggregates.quality_sla_count / aggregates.success_count if aggregates.success_count else 0
     
     return metrics
 
 def calculate_mean_time_to_recovery(jobs):
     """Simplified MTTR calculation"""
     # This would need more sophisticated logic in production
-    error_jobs = [job for job in jobs if job['status'] == 'ERROR']
-    if not error_jobs:
+    error_times = [job['total_time'] for job in jobs if job['status'] == 'ERROR']
+    if not error_times:
         return 0
-    return statistics.mean(job['total_time'] for job in error_jobs)
+    return sum(error_times) / len(error_times)
 
 def estimate_processing_cost(jobs):
     """Estimate processing cost based on resource usage"""
+    return estimate_processing_cost_for_seconds(sum(job['total_time'] for job in jobs))
+
+def estimate_processing_cost_for_seconds(total_cpu_seconds):
+    """Estimate processing cost for a total number of CPU seconds"""
     # Simplified cost model - in reality would integrate with cloud billing APIs
-    total_cpu_seconds = sum(job['total_time'] for job in jobs)
     # Assuming $0.10 per CPU hour as rough estimate
     return (total_cpu_seconds / 3600) * 0.10
 
@@ -553,13 +794,18 @@ def generate_security_insights(jobs):
     
     # Detect suspicious patterns
     file_hashes = {}
+    utf8_count = 0
+    safe_headers_count = 0
     for job in jobs:
-        # Simple hash of filename + file format for duplicate detection
-        file_sig = hashlib.md5(f"{job['file_name']}{job['file_format']}".encode()).hexdigest()
-        if file_sig in file_hashes:
-            file_hashes[file_sig].append(job)
-        else:
-            file_hashes[file_sig] = [job]
+        # Filename + file format signature for duplicate detection
+        file_sig = (job['file_name'], job['file_format'])
+        file_hashes.setdefault(file_sig, []).append(job)
+        
+        # Compliance tallies, gathered in the same pass
+        if job['encoding'] == 'UTF-8':
+            utf8_count += 1
+        if 'All headers safe' in job['db_safe_headers']:
+            safe_headers_count += 1
     
     # Flag potential security issues
     for file_sig, job_list in file_hashes.items():
@@ -573,8 +819,8 @@ def generate_security_insights(jobs):
             })
     
     # Data compliance scoring
-    encoding_compliance = sum(1 for job in jobs if job['encoding'] == 'UTF-8') / len(jobs) if jobs else 0
-    header_compliance = sum(1 for job in jobs if 'All headers safe' in job['db_safe_headers']) / len(jobs) if jobs else 0
+    encoding_compliance = utf8_count / len(jobs) if jobs else 0
+    header_compliance = safe_headers_count / len(jobs) if jobs else 0
     
     compliance_score = (encoding_compliance + header_compliance) / 2 * 100
     insights.append({
@@ -593,16 +839,39 @@ def enhanced_parse_worker_logs(log_file_path):
     
     # Add calculated fields
     for job in jobs:
-        if job['status'] == 'SUCCESS':
-            job['data_quality_score'] = calculate_data_quality_score(job)
-            job['processing_efficiency'] = int(job['records']) / job['total_time'] if job['total_time'] > 0 else 0
-        else:
-            # Add default values for failed jobs
-            job['data_quality_score'] = 0
-            job['processing_efficiency'] = 0
+        enrich_job(job)
     
     return jobs
 
+def enrich_job(job):
+    """Add the calculated fields to a parsed job, returning the same job"""
+    if job['status'] == 'SUCCESS':
+        job['data_quality_score'] = calculate_data_quality_score(job)
+        job['processing_efficiency'] = job['records'] / job['total_time'] if job['total_time'] > 0 else 0
+    else:
+        # Add default values for failed jobs
+        job['data_quality_score'] = 0
+        job['processing_efficiency'] = 0
+    return job
+
+def split_jobs_by_status(jobs):
+    """Split jobs into successful and failed lists in a single pass"""
+    successful_jobs = []
+    error_jobs = []
+    for job in jobs:
+        if job['status'] == 'SUCCESS':
+            successful_jobs.append(job)
+        elif job['status'] == 'ERROR':
+            error_jobs.append(job)
+    return successful_jobs, error_jobs
+
+def write_json(path, data, **kwargs):
+    """Write data as indented JSON with a single write call"""
+    # json.dump issues one write per encoded chunk; encoding to a string
+    # first and writing it once is considerably cheaper
+    with open(path, 'w') as f:
+        f.write(json.dumps(data, indent=2, **kwargs))
+
 def write_enhanced_analysis(jobs, output_file):
     """Write comprehensive analysis including new metrics"""
     # Standard analysis
@@ -610,64 +879,61 @@ def write_enhanced_analysis(jobs, output_file):
     
     # Generate additional analysis files
     base_path = Path(output_file).parent
+    successful_jobs, error_jobs = split_jobs_by_status(jobs)
+    aggregates = calculate_job_aggregates(jobs)
     
     # Performance insights
-    performance_metrics = calculate_processing_efficiency_metrics(jobs)
-    with open(base_path / 'performance_metrics.json', 'w') as f:
-        json.dump(performance_metrics, f, indent=2)
+    performance_metrics = calculate_processing_efficiency_metrics(jobs, successful_jobs)
+    write_json(base_path / 'performance_metrics.json', performance_metrics)
     
     # Business metrics
-    business_metrics = generate_business_impact_metrics(jobs)
-    with open(base_path / 'business_metrics.json', 'w') as f:
-        json.dump(business_metrics, f, indent=2)
+    business_metrics = generate_business_impact_metrics(jobs, aggregates)
+    write_json(base_path / 'business_metrics.json', business_metrics)
     
     # Failure analysis
-    failure_patterns = analyze_failure_patterns(jobs)
-    with open(base_path / 'failure_analysis.json', 'w') as f:
-        json.dump(failure_patterns, f, indent=2, default=str)
+    failure_patterns = analyze_failure_patterns(jobs, error_jobs)
+    write_json(base_path / 'failure_analysis.json', failure_patterns, default=str)
     
     # Predictive insights
-    predictions = generate_predictive_insights(jobs)
-    with open(base_path / 'predictive_insights.json', 'w') as f:
-        json.dump(predictions, f, indent=2)
+    predictions = generate_predictive_insights(jobs, successful_jobs)
+    write_json(base_path / 'predictive_insights.json', predictions)
     
     # Security insights
     security = generate_security_insights(jobs)
-    with open(base_path / 'security_analysis.json', 'w') as f:
-        json.dump(security, f, indent=2)
+    write_json(base_path / 'security_analysis.json', security)
     
     # Anomalies
-    anomalies = detect_performance_anomalies(jobs)
-    with open(base_path / 'anomalies.json', 'w') as f:
-        json.dump(anomalies, f, indent=2)
+    anomalies = detect_performance_anomalies(jobs, successful_jobs)
+    write_json(base_path / 'anomalies.json', anomalies)
 
-def generate_executive_summary(jobs):
+def generate_executive_summary(jobs, aggregates=None):
     """Generate C-level executive summary"""
-    total_jobs = len(jobs)
-    successful_jobs = [job for job in jobs if job['status'] == 'SUCCESS']
+    if aggregates is None:
+        aggregates = calculate_job_aggregates(jobs)
+    availability = aggregates.success_count / aggregates.total_jobs
     
     summary = {
         'executive_summary': {
-            'system_health': 'HEALTHY' if len(successful_jobs)/total_jobs >= 0.95 else 'DEGRADED' if len(successful_jobs)/total_jobs >= 0.80 else 'CRITICAL',
-            'availability_sla': len(successful_jobs)/total_jobs * 100,
-            'total_data_processed': f"{sum(int(job['records']) for job in successful_jobs):,} records",
-            'average_processing_time': f"{statistics.mean([job['total_time'] for job in successful_jobs]):.2f}s" if successful_jobs else "N/A",
-            'cost_efficiency_score': min(100, max(0, 100 - estimate_processing_cost(successful_jobs) * 1000)),  # Scaled for display
-            'data_quality_grade': get_quality_grade(jobs),
-            'key_recommendations': generate_top_recommendations(jobs)
+            'system_health': 'HEALTHY' if availability >= 0.95 else 'DEGRADED' if availability >= 0.80 else 'CRITICAL',
+            'availability_sla': availability * 100,
+            'total_data_processed': f"{aggregates.total_records:,} records",
+            'average_processing_time': f"{aggregates.avg_processing_time:.2f}s" if aggregates.success_count else "N/A",
+            'cost_efficiency_score': min(100, max(0, 100 - estimate_processing_cost_for_seconds(aggregates.total_processing_time) * 1000)),  # Scaled for display
+            'data_quality_grade': get_quality_grade(jobs, aggregates),
+            'key_recommendations': generate_top_recommendations(jobs, aggregates)
         }
     }
     
     return summary
 
-def get_quality_grade(jobs):
+def get_quality_grade(jobs, aggregates=None):
     """Convert quality scores to letter grades"""
-    successful_jobs = [job for job in jobs if job['status'] == 'SUCCESS']
-    if not successful_jobs:
+    if aggregates is None:
+        aggregates = calculate_job_aggregates(jobs)
+    if not aggregates.success_count:
         return 'F'
     
-    quality_scores = [calculate_data_quality_score(job) for job in successful_jobs]
-    avg_score = statistics.mean(quality_scores)
+    avg_score = aggregates.avg_data_quality
     
     if avg_score >= 90: return 'A'
     elif avg_score >= 80: return 'B'
@@ -675,46 +941,117 @@ def get_quality_grade(jobs):
     elif avg_score >= 60: return 'D'
     else: return 'F'
 
-def generate_top_recommendations(jobs):
+def generate_top_recommendations(jobs, aggregates=None):
     """Generate top 3 actionable recommendations"""
     recommendations = []
+    if aggregates is None:
+        aggregates = calculate_job_aggregates(jobs)
     
     # Analyze patterns and generate smart recommendations
-    error_jobs = [job for job in jobs if job['status'] == 'ERROR']
-    if len(error_jobs) / len(jobs) > 0.1:
+    if aggregates.error_count / aggregates.total_jobs > 0.1:
         recommendations.append("Implement pre-processing validation to reduce 10%+ failure rate")
     
-    successful_jobs = [job for job in jobs if job['status'] == 'SUCCESS']
-    if successful_jobs:
-        avg_time = statistics.mean(job['total_time'] for job in successful_jobs)
-        if avg_time > 5:
+    if aggregates.success_count:
+        if aggregates.avg_processing_time > 5:
             recommendations.append("Optimize processing pipeline - average 5+ second processing time")
         
-        quality_scores = [calculate_data_quality_score(job) for job in successful_jobs]
-        if statistics.mean(quality_scores) < 80:
+        if aggregates.avg_data_quality < 80:
             recommendations.append("Implement data quality gates - current average below 80%")
     
     return recommendations[:3]
 
+def iter_jobs_from_csv(csv_file):
+    """Yield jobs from CSV one row at a time with proper type conversion"""
+    try:
+        with open(csv_file, 'r', newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            # Convert numeric columns by position before building each job dict
+            float_columns = [i for i, field in enumerate(header) if field in FLOAT_FIELDS]
+            int_columns = [i for i, field in enumerate(header) if field in INT_FIELDS]
+            interned_columns = [i for i, field in enumerate(header) if field in INTERNED_FIELDS]
+            for row in reader:
+                # Skip blank lines, as DictReader did
+                if not row:
+                    continue
+                # Pad short rows with None, as DictReader did, rather than
+                # failing the positional conversions below
+                if len(row) < len(header):
+                    row += [None] * (len(header) - len(row))
+                # Empty cells fall back to zero through 'or' rather than a
+                # second lookup and branch per cell
+                for i in float_columns:
+                    row[i] = float(row[i] or 0.0)
+                for i in int_columns:
+                    row[i] = int(row[i] or 0)
+                for i in interned_columns:
+                    if row[i]:
+                        row[i] = sys.intern(row[i])
+                job = dict(zip(header, row))
+                if job['status'] != 'SUCCESS':
+                    job['data_quality_score'] = 0
+                elif job.get('data_quality_score'):
+                    job['data_quality_score'] = int(job['data_quality_score'])
+                else:
+                    job['data_quality_score'] = calculate_data_quality_score(job)
+                yield job
+    except FileNotFoundError:
+        print("Worker analysis file not found")
+        sys.exit(1)
+
+def jobs_cache_is_trusted(cache_stat):
+    """Only unpickle a cache file this user owns and nobody else can write"""
+    # The CSV often lives in a shared directory such as /tmp, where another
+    # user could otherwise plant a pickle with a matching size/mtime key
+    if hasattr(os, 'getuid') and cache_stat.st_uid != os.getuid():
+        return False
+    return not cache_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+def write_jobs_cache(cache_file, cache_key, jobs):
+    """Atomically replace the cache file with a private (0600) pickle"""
+    fd, tmp_name = tempfile.mkstemp(dir=cache_file.parent, prefix=cache_file.name, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump((cache_key, jobs), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, cache_file)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
 def load_jobs_from_csv(csv_file):
     """Load jobs from CSV with proper type conversion"""
-    jobs = []
+    # Parsed jobs are cached in a pickle sidecar next to the CSV, keyed on the
+    # CSV's size and mtime, so repeated commands skip re-parsing it
     try:
-        with open(csv_file, 'r') as f:
-            reader = csv.DictReader(f)
-            jobs = list(reader)
-            # Convert numeric fields
-            for job in jobs:
-                for field in ['total_time', 'download_time', 'analysis_time', 'copying_time', 
-                              'indexing_time', 'formulae_time', 'metadata_time']:
-                    job[field] = float(job[field]) if job[field] else 0.0
-                for field in ['records', 'rows_copied', 'columns_indexed']:
-                    job[field] = int(job[field]) if job[field] else 0
+        csv_stat = Path(csv_file).stat()
     except FileNotFoundError:
         print("Worker analysis file not found")
         sys.exit(1)
+    cache_file = Path(f"{csv_file}{JOBS_CACHE_SUFFIX}")
+    cache_key = (JOBS_CACHE_VERSION, csv_stat.st_size, csv_stat.st_mtime_ns)
+    try:
+        with open(cache_file, 'rb') as f:
+            if jobs_cache_is_trusted(os.fstat(f.fileno())):
+                cached_key, jobs = pickle.load(f)
+                if cached_key == cache_key:
+                    return jobs
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+        pass
+    
+    jobs = list(iter_jobs_from_csv(csv_file))
+    
+    try:
+        write_jobs_cache(cache_file, cache_key, jobs)
+    except OSError:
+        pass
     return jobs
 
+def print_lines(lines):
+    """Write lines to stdout in a single call rather than one print per line"""
+    output = '\n'.join(lines)
+    if output:
+        sys.stdout.write(output + '\n')
+
 def main():
     if len(sys.argv) < 2:
         print("Usage: python log_analyzer.py <command> [args...]")
@@ -750,8 +1087,7 @@ def main():
         
         jobs = load_jobs_from_csv(worker_csv)
         insights = generate_performance_insights(jobs)
-        for insight in insights:
-            print(insight)
+        print_lines(insights)
     
     elif command == "file-insight":
         if len(sys.argv) < 4:
@@ -761,7 +1097,8 @@ def main():
         worker_csv = sys.argv[2]
         filename = sys.argv[3]
         
-        jobs = load_jobs_from_csv(worker_csv)
+        # Stream rows so the lookup stops reading at the first matching job
+        jobs = iter_jobs_from_csv(worker_csv)
         insight = get_worker_insight_for_file(jobs, filename)
         print(insight)
         
@@ -781,8 +1118,8 @@ def main():
             
         jobs = load_jobs_from_csv(sys.argv[2])
         anomalies = detect_performance_anomalies(jobs)
-        for anomaly in anomalies:
-            print(f"ANOMALY: {anomaly['file']} took {anomaly['actual_time']:.2f}s ({anomaly['deviation_factor']:.1f}x expected)")
+        print_lines(f"ANOMALY: {anomaly['file']} took {anomaly['actual_time']:.2f}s ({anomaly['deviation_factor']:.1f}x expected)"
+                    for anomaly in anomalies)
     
     elif command == "business-metrics":
         if len(sys.argv) < 3:
@@ -791,11 +1128,8 @@ def main():
             
         jobs = load_jobs_from_csv(sys.argv[2])
         metrics = generate_business_impact_metrics(jobs)
-        for metric, value in metrics.items():
-            if isinstance(value, float):
-                print(f"{metric}: {value:.3f}")
-            else:
-                print(f"{metric}: {value}")
+        print_lines(f"{metric}: {value:.3f}" if isinstance(value, float) else f"{metric}: {value}"
+                    for metric, value in metrics.items())
     
     else:
         print(f"Unknown command: {command}")